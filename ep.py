@@ -1,9 +1,141 @@
-import random
-from typing import List, Dict, Tuple, Set
-from collections import defaultdict
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Set, Optional
+from collections import defaultdict, OrderedDict
+
+import numpy as np
+from numba import njit
+
+# Tabelas constantes do problema, compartilhadas com os processos
+# trabalhadores via initializer do pool (evita serializá-las a cada chamada)
+_GRANDE_MASK: np.ndarray = np.zeros(0, dtype=bool)
+_CODIGO_ESPERADO: np.ndarray = np.zeros(0, dtype=bool)
+_N_TIMES: int = 0
+_N_RODADAS: int = 0
+
+def _init_worker(grande_mask: np.ndarray, codigo_esperado: np.ndarray,
+                 n_times: int, n_rodadas: int) -> None:
+    """Instala as tabelas do campeonato como globais do processo"""
+    global _GRANDE_MASK, _CODIGO_ESPERADO, _N_TIMES, _N_RODADAS
+    _GRANDE_MASK = grande_mask
+    _CODIGO_ESPERADO = codigo_esperado
+    _N_TIMES = n_times
+    _N_RODADAS = n_rodadas
+
+@njit(cache=True)
+def _fitness_nb(cal: np.ndarray, grande_mask: np.ndarray,
+                codigo_esperado: np.ndarray, n_times: int, n_rodadas: int) -> float:
+    """Kernel JIT do fitness sobre o array int16 (N, 4) de um calendário"""
+    penalidades = 0
+
+    # Verifica se todos os jogos foram agendados
+    n_jogos = cal.shape[0]
+    n_esperados = int(codigo_esperado.sum())
+    if n_jogos != n_esperados:
+        penalidades += 1000 * (n_esperados - n_jogos)
+
+    # Passada única sobre o calendário: bitmasks SWAR de pertinência por
+    # rodada (com 14 times e ~10 cidades, testar/inserir é um AND/OR),
+    # contador de clássicos e contagem de confrontos atualizados juntos
+    times_mask = np.zeros(n_rodadas + 1, dtype=np.int64)
+    cidades_mask = np.zeros(n_rodadas + 1, dtype=np.int64)
+    classicos = np.zeros(n_rodadas + 1, dtype=np.int8)
+    contagem = np.zeros(n_times * n_times, dtype=np.int16)
+
+    for k in range(n_jogos):
+        mandante = cal[k, 0]
+        visitante = cal[k, 1]
+        rodada = cal[k, 2]
+
+        # 1. Time não pode jogar mais de uma vez por rodada
+        if (times_mask[rodada] >> mandante) & 1 or (times_mask[rodada] >> visitante) & 1:
+            penalidades += 100
+
+        times_mask[rodada] |= (1 << mandante) | (1 << visitante)
+
+        # 2. Cidade não pode ter mais de um jogo por rodada (a cidade do
+        # mandante vem na própria linha, sem indireção por cidade_of)
+        cidade = cal[k, 3]
+        if (cidades_mask[rodada] >> cidade) & 1:
+            penalidades += 50
+
+        cidades_mask[rodada] |= 1 << cidade
+
+        # 3. Verifica clássicos (entre os 5 maiores times)
+        if grande_mask[mandante] and grande_mask[visitante]:
+            classicos[rodada] += 1
+
+        contagem[mandante * n_times + visitante] += 1
+
+    # 4. Não pode ter mais de um clássico por rodada
+    for rodada in range(n_rodadas + 1):
+        if classicos[rodada] > 1:
+            penalidades += 200 * (classicos[rodada] - 1)
+
+    # Verifica se todos os confrontos foram agendados (turno e returno)
+    penalidades += 300 * int(np.sum((contagem != 1) & codigo_esperado))
+
+    # Fitness é inversamente proporcional às penalidades
+    return 1.0 / (1.0 + penalidades)
+
+@njit(cache=True)
+def _reparar_nb(cal: np.ndarray) -> np.ndarray:
+    """Kernel JIT do reparo: mantém, por rodada, só os jogos sem violação
+
+    Com 14 times e ~10 cidades, a pertinência por rodada cabe em bitmasks
+    de uma palavra: testar/inserir um time é um AND/OR em vez de um set.
+    """
+    n_jogos = cal.shape[0]
+    # Ordenação estável por rodada preserva a ordem original dos jogos
+    # dentro de cada rodada, como o agrupamento por dict fazia
+    ordem = np.argsort(cal[:, 2], kind='mergesort')
+
+    saida = np.empty((n_jogos, 4), dtype=np.int16)
+    n_validos = 0
+    rodada_atual = -1
+    times_mask = 0
+    cidades_mask = 0
+
+    for k in range(n_jogos):
+        idx = ordem[k]
+        mandante = cal[idx, 0]
+        visitante = cal[idx, 1]
+        rodada = cal[idx, 2]
+        cidade = cal[idx, 3]
+
+        if rodada != rodada_atual:
+            rodada_atual = rodada
+            times_mask = 0
+            cidades_mask = 0
+
+        # Verifica se o jogo pode ser incluído sem violar restrições
+        if ((times_mask >> mandante) & 1) == 0 and \
+           ((times_mask >> visitante) & 1) == 0 and \
+           ((cidades_mask >> cidade) & 1) == 0:
+            saida[n_validos, 0] = mandante
+            saida[n_validos, 1] = visitante
+            saida[n_validos, 2] = rodada
+            saida[n_validos, 3] = cidade
+            n_validos += 1
+            times_mask |= (1 << mandante) | (1 << visitante)
+            cidades_mask |= 1 << cidade
+
+    return saida[:n_validos].copy()
+
+def _fitness(genes: np.ndarray) -> float:
+    """Avalia um calendário usando o kernel JIT e as tabelas do processo
+
+    Wrapper picklável para o ProcessPoolExecutor; as tabelas constantes
+    vêm dos globais instalados por _init_worker.
+    """
+    return _fitness_nb(genes, _GRANDE_MASK, _CODIGO_ESPERADO,
+                       _N_TIMES, _N_RODADAS)
 
 class Time:
     """Classe que representa um time de futebol"""
+    __slots__ = ('nome', 'cidade', 'torcedores')
+
     def __init__(self, nome: str, cidade: str, torcedores: int):
         self.nome = nome
         self.cidade = cidade
@@ -14,6 +146,8 @@ class Time:
 
 class Partida:
     """Representa uma partida entre dois times"""
+    __slots__ = ('mandante', 'visitante', 'rodada')
+
     def __init__(self, mandante: Time, visitante: Time, rodada: int):
         self.mandante = mandante
         self.visitante = visitante
@@ -22,222 +156,287 @@ class Partida:
     def __repr__(self):
         return f"{self.mandante} x {self.visitante} (Rodada {self.rodada})"
 
+@dataclass(slots=True)
+class Individuo:
+    """Candidato da população: um calendário e seu fitness memoizado
+
+    Os genes são um array int16 de forma (N, 4) com colunas
+    [mandante_id, visitante_id, rodada, cidade_do_mandante]; Partida só
+    é reconstruída para exibição no final.
+    """
+    genes: np.ndarray
+    fitness: Optional[float] = None
+
 class Campeonato:
     """Classe principal que implementa o algoritmo genético para organizar o campeonato"""
 
-    def __init__(self, times: List[Time], num_rodadas: int = 26, tamanho_populacao: int = 100):
+    def __init__(self, times: List[Time], num_rodadas: int = 26,
+                 tamanho_populacao: int = 100, seed: Optional[int] = None):
         self.times = times
         self.num_times = len(times)
         self.num_rodadas = num_rodadas
         self.tamanho_populacao = tamanho_populacao
         self.jogos_por_rodada = self.num_times // 2
 
+        # Gerador único (PCG64) para toda a aleatoriedade do algoritmo;
+        # sorteios em lote saem muito mais baratos que chamadas avulsas
+        self.rng = np.random.default_rng(seed)
+
+        # Cache LRU hash(calendário) -> fitness: elitismo e filhos
+        # quase idênticos após o reparo geram muitos repetidos
+        self._fitness_cache: OrderedDict[int, float] = OrderedDict()
+        self._fitness_cache_max = 4 * tamanho_populacao
+
         # Times grandes (5 maiores por torcida)
         self.times_grandes = sorted(times, key=lambda x: -x.torcedores)[:5]
 
-        # Gerar todos os confrontos possíveis (turno e returno)
-        self.todos_jogos = []
-        for i in range(self.num_times):
-            for j in range(self.num_times):
-                if i != j:
-                    self.todos_jogos.append((times[i], times[j]))
-
-    def gerar_populacao_inicial(self) -> List[List[Partida]]:
+        # Gerar todos os confrontos possíveis (turno e returno) já como
+        # array de pares de ids, materializado uma única vez
+        self.todos_jogos_arr = np.array(
+            [(i, j) for i in range(self.num_times)
+             for j in range(self.num_times) if i != j],
+            dtype=np.int16)
+
+        # Codificação inteira dos times/cidades para a avaliação paralela
+        self.time_id = {time: i for i, time in enumerate(times)}
+        cidades = sorted({time.cidade for time in times})
+        self.cidade_id = {cidade: i for i, cidade in enumerate(cidades)}
+        self.cidade_do_time = [self.cidade_id[time.cidade] for time in times]
+
+        # Índice O(1) de confronto -> posição em todos_jogos_arr e máscara
+        # dos códigos de confronto válidos (código = mandante*n + visitante)
+        self.confronto_idx = {(int(m), int(v)): k
+                              for k, (m, v) in enumerate(self.todos_jogos_arr)}
+        self.codigo_esperado = np.zeros(self.num_times * self.num_times, dtype=bool)
+        codigos = (self.todos_jogos_arr[:, 0].astype(np.int32) * self.num_times
+                   + self.todos_jogos_arr[:, 1])
+        self.codigo_esperado[codigos] = True
+
+        # Máscara booleana dos times grandes, indexada por id de time
+        self.grande_mask = np.zeros(self.num_times, dtype=bool)
+        self.grande_mask[[self.time_id[time] for time in self.times_grandes]] = True
+
+        # Instala as tabelas no processo principal também, para que
+        # _fitness funcione fora do pool
+        _init_worker(self.grande_mask, self.codigo_esperado,
+                     self.num_times, self.num_rodadas)
+
+        # Aquecimento do JIT: dispara a compilação dos kernels (ou o
+        # carregamento do cache em disco — cache=True respeita
+        # NUMBA_CACHE_DIR) aqui, em vez de no meio da primeira geração
+        aquecimento = np.zeros((2, 4), dtype=np.int16)
+        _fitness_nb(aquecimento, self.grande_mask, self.codigo_esperado,
+                    self.num_times, self.num_rodadas)
+        _reparar_nb(aquecimento)
+
+    def gerar_populacao_inicial(self) -> List[Individuo]:
         """Gera uma população inicial de calendários aleatórios"""
         populacao = []
         for _ in range(self.tamanho_populacao):
             calendario = []
-            jogos_disponiveis = self.todos_jogos.copy()
-            random.shuffle(jogos_disponiveis)
+            jogos_disponiveis = self.rng.permutation(self.todos_jogos_arr).tolist()
+            # Cursor sobre a lista embaralhada: avançar é O(1), ao contrário
+            # de pop(0), que desloca todos os elementos restantes
+            cursor = 0
+            total_jogos = len(jogos_disponiveis)
 
             for rodada in range(1, self.num_rodadas + 1):
                 jogos_rodada = []
-                times_na_rodada = set()
-                cidades_na_rodada = set()
+                # Bitmasks de pertinência da rodada, como no kernel de reparo
+                times_mask = 0
+                cidades_mask = 0
 
-                while len(jogos_rodada) < self.jogos_por_rodada and jogos_disponiveis:
-                    jogo = jogos_disponiveis.pop(0)
-                    mandante, visitante = jogo
+                while len(jogos_rodada) < self.jogos_por_rodada and cursor < total_jogos:
+                    mandante, visitante = jogos_disponiveis[cursor]
+                    cursor += 1
+                    cidade = self.cidade_do_time[mandante]
 
                     # Verifica restrições
-                    if (mandante not in times_na_rodada and
-                        visitante not in times_na_rodada and
-                        mandante.cidade not in cidades_na_rodada):
+                    if not ((times_mask >> mandante) & 1 or
+                            (times_mask >> visitante) & 1 or
+                            (cidades_mask >> cidade) & 1):
 
-                        jogos_rodada.append(Partida(mandante, visitante, rodada))
-                        times_na_rodada.add(mandante)
-                        times_na_rodada.add(visitante)
-                        cidades_na_rodada.add(mandante.cidade)
+                        jogos_rodada.append((mandante, visitante, rodada, cidade))
+                        times_mask |= (1 << mandante) | (1 << visitante)
+                        cidades_mask |= 1 << cidade
 
                 calendario.extend(jogos_rodada)
 
-            populacao.append(calendario)
+            populacao.append(Individuo(np.array(calendario, dtype=np.int16)))
 
         return populacao
 
-    def calcular_fitness(self, calendario: List[Partida]) -> float:
-        """Calcula a qualidade de um calendário considerando as restrições"""
-        penalidades = 0
-
-        # Verifica se todos os jogos foram agendados
-        if len(calendario) != len(self.todos_jogos):
-            penalidades += 1000 * (len(self.todos_jogos) - len(calendario))
-
-        # Verifica restrições por rodada
-        rodadas = defaultdict(list)
-        for partida in calendario:
-            rodadas[partida.rodada].append(partida)
-
-        for rodada, jogos in rodadas.items():
-            times_rodada = set()
-            cidades_rodada = set()
-            classicos_rodada = 0
-
-            for jogo in jogos:
-                # 1. Time não pode jogar mais de uma vez por rodada
-                if jogo.mandante in times_rodada or jogo.visitante in times_rodada:
-                    penalidades += 100
-
-                times_rodada.add(jogo.mandante)
-                times_rodada.add(jogo.visitante)
-
-                # 2. Cidade não pode ter mais de um jogo por rodada
-                if jogo.mandante.cidade in cidades_rodada:
-                    penalidades += 50
-
-                cidades_rodada.add(jogo.mandante.cidade)
-
-                # 3. Verifica clássicos (entre os 5 maiores times)
-                if (jogo.mandante in self.times_grandes and
-                    jogo.visitante in self.times_grandes):
-                    classicos_rodada += 1
-
-            # 4. Não pode ter mais de um clássico por rodada
-            if classicos_rodada > 1:
-                penalidades += 200 * (classicos_rodada - 1)
-
-        # Verifica se todos os confrontos foram agendados (turno e returno)
-        confrontos_agendados = defaultdict(int)
-        for partida in calendario:
-            confronto = (partida.mandante, partida.visitante)
-            confrontos_agendados[confronto] += 1
-
-        for jogo in self.todos_jogos:
-            if confrontos_agendados[jogo] != 1:
-                penalidades += 300
-
-        # Fitness é inversamente proporcional às penalidades
-        return 1 / (1 + penalidades)
-
-    def selecionar_pais(self, populacao: List[List[Partida]]) -> List[List[Partida]]:
-        """Seleção por torneio"""
-        pais = []
-        for _ in range(2):
-            participantes = random.sample(populacao, 3)
-            melhor = max(participantes, key=lambda x: self.calcular_fitness(x))
-            pais.append(melhor)
-        return pais
-
-    def crossover(self, pai1: List[Partida], pai2: List[Partida]) -> List[Partida]:
+    def decodificar_genes(self, genes: np.ndarray) -> List[Partida]:
+        """Reconstrói objetos Partida a partir do array de genes, para exibição"""
+        return [Partida(self.times[mandante], self.times[visitante], rodada)
+                for mandante, visitante, rodada, _ in genes.tolist()]
+
+    def calcular_fitness(self, individuo: Individuo) -> float:
+        """Calcula a qualidade de um calendário considerando as restrições
+
+        O resultado fica memoizado no indivíduo, então cada candidato é
+        avaliado no máximo uma vez por mudança nos genes.
+        """
+        if individuo.fitness is None:
+            individuo.fitness = _fitness(individuo.genes)
+        return individuo.fitness
+
+    def avaliar_populacao(self, populacao: List[Individuo], pool: ProcessPoolExecutor) -> None:
+        """Avalia em paralelo todos os indivíduos ainda sem fitness (mestre-escravo)
+
+        Calendários idênticos (elitismo, filhos iguais após o reparo) são
+        resolvidos pelo cache LRU de hashes antes de ir para o pool.
+        """
+        pendentes = []
+        for individuo in populacao:
+            if individuo.fitness is not None:
+                continue
+
+            chave = hash(individuo.genes.tobytes())
+            fitness = self._fitness_cache.get(chave)
+            if fitness is not None:
+                individuo.fitness = fitness
+                self._fitness_cache.move_to_end(chave)
+            else:
+                pendentes.append((chave, individuo))
+
+        if not pendentes:
+            return
+
+        lotes = [individuo.genes for _, individuo in pendentes]
+        chunksize = max(1, len(pendentes) // (os.cpu_count() or 1))
+        for (chave, individuo), fitness in zip(pendentes,
+                                               pool.map(_fitness, lotes, chunksize=chunksize)):
+            individuo.fitness = fitness
+            self._fitness_cache[chave] = fitness
+
+        while len(self._fitness_cache) > self._fitness_cache_max:
+            self._fitness_cache.popitem(last=False)
+
+    def selecionar_pais(self, populacao: List[Individuo],
+                        scores: np.ndarray) -> List[Individuo]:
+        """Seleção por torneio, lendo os scores já avaliados da geração
+
+        Sorteia os dois torneios de 3 participantes de uma vez e decide
+        os vencedores por argmax sobre o array de scores, sem nenhuma
+        chamada de fitness.
+        """
+        idx = self.rng.integers(0, len(populacao), size=(2, 3))
+        vencedores = idx[np.arange(2), scores[idx].argmax(axis=1)]
+        return [populacao[i] for i in vencedores]
+
+    def crossover(self, pai1: Individuo, pai2: Individuo) -> Individuo:
         """Crossover personalizado para o problema"""
         # Escolhe um ponto de corte aleatório
-        ponto_corte = random.randint(0, len(pai1) - 1)
+        ponto_corte = int(self.rng.integers(0, len(pai1.genes)))
 
         # Cria filho com a primeira parte do pai1
-        filho = pai1[:ponto_corte]
+        filho = pai1.genes[:ponto_corte].tolist()
 
-        # Adiciona jogos do pai2 que não estão no filho e não violam restrições
-        jogos_filho = {(p.mandante, p.visitante) for p in filho}
+        # Capacidade por rodada, semeada com o prefixo do pai1: sem isso o
+        # filho cresce até quase todos os confrontos e infla o reparo e o
+        # fitness seguintes
+        limite_total = self.num_rodadas * self.jogos_por_rodada
+        contagem_rodada = np.zeros(self.num_rodadas + 1, dtype=np.int8)
+        for _, _, rodada, _ in filho:
+            contagem_rodada[rodada] += 1
 
-        for partida in pai2:
-            confronto = (partida.mandante, partida.visitante)
+        # Adiciona jogos do pai2 que não estão no filho e não violam restrições
+        jogos_filho = {(mandante, visitante) for mandante, visitante, _, _ in filho}
+
+        for mandante, visitante, rodada, cidade in pai2.genes.tolist():
+            if len(filho) >= limite_total:
+                break
+            if contagem_rodada[rodada] == self.jogos_por_rodada:
+                continue
+            confronto = (mandante, visitante)
             if confronto not in jogos_filho:
-                filho.append(partida)
+                filho.append((mandante, visitante, rodada, cidade))
                 jogos_filho.add(confronto)
+                contagem_rodada[rodada] += 1
 
-        return filho
+        return Individuo(np.array(filho, dtype=np.int16))
 
-    def mutacao(self, calendario: List[Partida]) -> List[Partida]:
-        """Operador de mutação"""
-        if random.random() < 0.1:  # 10% de chance de mutação
-            # Escolhe duas partidas aleatórias para trocar
-            idx1, idx2 = random.sample(range(len(calendario)), 2)
-            calendario[idx1], calendario[idx2] = calendario[idx2], calendario[idx1]
+    def mutacao(self, individuo: Individuo) -> Individuo:
+        """Operador de mutação: troca duas partidas aleatórias de lugar
 
-        return calendario
-
-    def reparar_calendario(self, calendario: List[Partida]) -> List[Partida]:
-        """Tenta consertar violações de restrições"""
-        # Agrupa partidas por rodada
-        rodadas = defaultdict(list)
-        for partida in calendario:
-            rodadas[partida.rodada].append(partida)
+        O sorteio de quem muta (10% de chance) é feito em lote no
+        executar; aqui a troca é aplicada incondicionalmente.
+        """
+        calendario = individuo.genes
+        idx1, idx2 = self.rng.choice(len(calendario), size=2, replace=False)
+        calendario[[idx1, idx2]] = calendario[[idx2, idx1]]
+        # A troca invalida o fitness memoizado
+        individuo.fitness = None
 
-        calendario_reparado = []
+        return individuo
 
-        for rodada, jogos in rodadas.items():
-            times_usados = set()
-            cidades_usadas = set()
-            jogos_validos = []
-
-            for jogo in jogos:
-                # Verifica se o jogo pode ser incluído sem violar restrições
-                if (jogo.mandante not in times_usados and
-                    jogo.visitante not in times_usados and
-                    jogo.mandante.cidade not in cidades_usadas):
-
-                    jogos_validos.append(jogo)
-                    times_usados.add(jogo.mandante)
-                    times_usados.add(jogo.visitante)
-                    cidades_usadas.add(jogo.mandante.cidade)
+    def reparar_calendario(self, individuo: Individuo) -> Individuo:
+        """Tenta consertar violações de restrições"""
+        return Individuo(_reparar_nb(individuo.genes))
 
-            calendario_reparado.extend(jogos_validos)
+    def executar(self, geracoes: int = 100,
+                 num_filhos: int = 20) -> Tuple[List[Partida], float]:
+        """Executa o algoritmo genético (estado estacionário)
 
-        return calendario_reparado
+        Em vez de reconstruir a população inteira a cada geração, produz
+        apenas num_filhos filhos por iteração e os coloca no lugar dos
+        num_filhos piores indivíduos. Só os filhos novos são avaliados; o
+        melhor nunca é substituído, então o elitismo é implícito.
+        """
+        num_filhos = min(num_filhos, self.tamanho_populacao - 1)
 
-    def executar(self, geracoes: int = 100) -> Tuple[List[Partida], float]:
-        """Executa o algoritmo genético"""
-        populacao = self.gerar_populacao_inicial()
-        melhor_calendario = max(populacao, key=lambda x: self.calcular_fitness(x))
-        melhor_fitness = self.calcular_fitness(melhor_calendario)
+        # Pool criado uma única vez; o initializer envia as tabelas do
+        # problema aos workers para não serializá-las a cada geração
+        with ProcessPoolExecutor(initializer=_init_worker,
+                                 initargs=(self.grande_mask, self.codigo_esperado,
+                                           self.num_times, self.num_rodadas)) as pool:
+            populacao = self.gerar_populacao_inicial()
+            self.avaliar_populacao(populacao, pool)
+            scores = np.array([ind.fitness for ind in populacao])
 
-        print(f"Geração 0 - Melhor fitness: {melhor_fitness:.4f}")
+            melhor_fitness = float(scores.max())
 
-        for geracao in range(1, geracoes + 1):
-            nova_populacao = []
+            print(f"Geração 0 - Melhor fitness: {melhor_fitness:.4f}")
 
-            # Elitismo: mantém o melhor indivíduo
-            nova_populacao.append(melhor_calendario)
+            for geracao in range(1, geracoes + 1):
+                filhos = []
 
-            while len(nova_populacao) < self.tamanho_populacao:
-                # Seleciona pais
-                pais = self.selecionar_pais(populacao)
+                while len(filhos) < num_filhos:
+                    # Seleciona pais
+                    pais = self.selecionar_pais(populacao, scores)
 
-                # Aplica crossover
-                filho = self.crossover(pais[0], pais[1])
+                    # Aplica crossover
+                    filho = self.crossover(pais[0], pais[1])
 
-                # Aplica mutação
-                filho = self.mutacao(filho)
+                    # Repara o calendário se necessário
+                    filho = self.reparar_calendario(filho)
 
-                # Repara o calendário se necessário
-                filho = self.reparar_calendario(filho)
+                    filhos.append(filho)
 
-                nova_populacao.append(filho)
+                # Aplica mutação em lote: um único sorteio vetorizado
+                # decide quais filhos mutam (10% de chance cada)
+                muta = self.rng.random(len(filhos)) < 0.1
+                for filho, deve_mutar in zip(filhos, muta):
+                    if deve_mutar:
+                        self.mutacao(filho)
 
-            populacao = nova_populacao
+                # Avalia só os filhos novos, em paralelo
+                self.avaliar_populacao(filhos, pool)
 
-            # Atualiza o melhor calendário
-            melhor_atual = max(populacao, key=lambda x: self.calcular_fitness(x))
-            fitness_atual = self.calcular_fitness(melhor_atual)
+                # Substitui os num_filhos piores indivíduos pelos filhos
+                piores = np.argpartition(scores, num_filhos)[:num_filhos]
+                for destino, filho in zip(piores, filhos):
+                    populacao[destino] = filho
+                    scores[destino] = filho.fitness
 
-            if fitness_atual > melhor_fitness:
-                melhor_calendario = melhor_atual
-                melhor_fitness = fitness_atual
+                melhor_fitness = float(scores.max())
 
-            if geracao % 10 == 0:
-                print(f"Geração {geracao} - Melhor fitness: {melhor_fitness:.4f}")
+                if geracao % 10 == 0:
+                    print(f"Geração {geracao} - Melhor fitness: {melhor_fitness:.4f}")
 
-        return melhor_calendario, melhor_fitness
+        melhor_calendario = populacao[int(np.argmax(scores))]
+        return self.decodificar_genes(melhor_calendario.genes), melhor_fitness
 
 def main():
     # Definindo os times do campeonato
@@ -268,7 +467,7 @@ def main():
     print("\n=== Melhor Calendário Encontrado ===")
     print(f"Fitness: {fitness:.4f}")
     print(f"Total de jogos agendados: {len(melhor_calendario)}")
-    print(f"Jogos esperados: {len(campeonato.todos_jogos)}")
+    print(f"Jogos esperados: {len(campeonato.todos_jogos_arr)}")
 
     # Organiza por rodada para exibição
     rodadas = defaultdict(list)